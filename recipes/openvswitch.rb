@@ -191,7 +191,10 @@ if node['openstack']['network']['disable_offload']
   end
 end
 
-# From http://git.openvswitch.org/cgi-bin/gitweb.cgi?p=openvswitch;a=blob_plain;f=utilities/ovs-dpctl-top.in;h=f43fdeb7ab52e3ef642a22579036249ec3a4bc22;hb=14b4c575c28421d1181b509dbeae6e4849c7da69
+# Locally modified fork of the upstream ovs-dpctl-top, originally from
+# http://git.openvswitch.org/cgi-bin/gitweb.cgi?p=openvswitch;a=blob_plain;f=utilities/ovs-dpctl-top.in;h=f43fdeb7ab52e3ef642a22579036249ec3a4bc22;hb=14b4c575c28421d1181b509dbeae6e4849c7da69
+# It adds output formats, an exporter, filtering and profiling, and no
+# longer matches upstream.
 cookbook_file 'ovs-dpctl-top' do
   path '/usr/bin/ovs-dpctl-top'
   source 'ovs-dpctl-top'